@@ -65,6 +65,8 @@ ORDINAL_MAP = {
 
 
 def strip_accents(s: str) -> str:
+    if s.isascii():
+        return s
     return ''.join(c for c in unicodedata.normalize('NFKD', s) if not unicodedata.combining(c))
 
 
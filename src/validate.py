@@ -10,15 +10,32 @@ Data source: https://cthru.data.socrata.com/resource/9ttk-7vz6.csv
 from __future__ import annotations
 
 import json
+import re
 import time
 import unicodedata
+import urllib.parse
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 import hashlib
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401  (parquet engine for the CTHRU cache)
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 # Variance status thresholds
 THRESHOLD_OK = 1500
@@ -37,8 +54,34 @@ LEADERSHIP_LOW_THRESHOLD = 75
 OVERPAYMENT_THRESHOLD = 110  # CTHRU > 110% suggests payment timing issue
 HIGH_LEADERSHIP_STIPEND = 50000  # Threshold for "high" leadership compensation
 
-# Common nickname mappings (bidirectional)
-NICKNAME_MAP = {
+# Status labels in rule order; the last entry is the catch-all
+VARIANCE_STATUSES = (
+    "NO_MATCH",
+    "OK",
+    "PARTIAL_OR_ROLE_CHANGE",
+    "LIKELY_ANNUALIZED",
+    "INVESTIGATE_PARTIAL_YEAR",
+    "INVESTIGATE_OVERPAYMENT",
+    "INVESTIGATE_LEADERSHIP",
+    "INVESTIGATE",
+)
+_VARIANCE_STATUS_LABELS = np.array(VARIANCE_STATUSES, dtype=object)
+
+# CTHRU columns requested from Socrata (everything else is unused)
+CTHRU_COLUMNS = [
+    "name_last", "name_first", "department_division", "year",
+    "pay_total_actual", "pay_base_actual", "pay_other_actual",
+]
+
+# department_division substrings (case-insensitive) marking Legislature rows
+LEGISLATURE_KEYWORDS = [
+    "LEGISLATURE", "HOUSE", "SENATE",
+    "GENERAL COURT", "REPRESENTATIVE",
+]
+
+# Common nickname mappings (bidirectional). Read-only: norm_name results are
+# memoized, so edits at runtime would not reach already-normalized names.
+NICKNAME_MAP = MappingProxyType({
     # Both directions to catch either format
     "mike": "michael",
     "michael": "michael",
@@ -104,7 +147,7 @@ NICKNAME_MAP = {
     "emmanuel": "emmanuel",
     "buddy": "buddy",
     "bud": "buddy",
-}
+})
 
 # Manual name mapping: Model name → CTHRU name
 # 
@@ -151,7 +194,7 @@ NICKNAME_MAP = {
 # - Test that both sides produce same normalized output
 # - Run validation, check NO_MATCH list, add mappings as needed
 
-NAME_MANUAL_MAP = {
+NAME_MANUAL_MAP = MappingProxyType({
     # Compound surnames (space-separated in model, hyphenated in reality)
     # Note: hyphens are removed during normalization, so keys have spaces
     "alice hanlon peisch": "alice hanlon",  # "Hanlon Peisch" compound → CTHRU splits as "hanlon peisch alice"
@@ -197,7 +240,23 @@ NAME_MANUAL_MAP = {
     
     # Legal name vs nickname variations
     "emmanuel cruz": "cruz victor",  # Manny (Emmanuel) Cruz → Victor Cruz in CTHRU (legal name)
-}
+})
+
+# Generational suffixes stripped from the end of names (after comma or space)
+NAME_SUFFIXES = [
+    ", Jr.", ", Jr", ", Sr.", ", Sr",
+    ", II", ", III", ", IV", ", V",
+    ", 2nd", ", 3rd", ", 4th",
+    " Jr.", " Jr", " Sr.", " Sr",
+    " II", " III", " IV", " V",
+]
+_SUFFIX_RE = re.compile(
+    "(?:" + "|".join(re.escape(suffix) for suffix in NAME_SUFFIXES) + ")$"
+)
+
+# Punctuation replaced by spaces during normalization (apostrophes split
+# O'Name into two words; see NAME_MANUAL_MAP)
+_PUNCT_RE = re.compile(r"[,.'\-–—]")
 
 
 def remove_accents(s: str) -> str:
@@ -209,6 +268,10 @@ def remove_accents(s: str) -> str:
         "Gómez" -> "Gomez"
         "Hernández" -> "Hernandez"
     """
+    # Nearly all payroll names are plain ASCII: nothing to decompose
+    if s.isascii():
+        return s
+
     # Normalize to NFD (decomposed form), then filter out combining marks
     nfd = unicodedata.normalize('NFD', s)
     return ''.join(char for char in nfd
@@ -224,19 +287,9 @@ def remove_suffix(s: str) -> str:
         "John Barrett, III" -> "John Barrett"
         "Angelo Jr. Puppolo" -> "Angelo Puppolo"
     """
-    # Remove common suffixes at end (after comma or space)
-    suffixes = [
-        ", Jr.", ", Jr", ", Sr.", ", Sr",
-        ", II", ", III", ", IV", ", V",
-        ", 2nd", ", 3rd", ", 4th",
-        " Jr.", " Jr", " Sr.", " Sr",
-        " II", " III", " IV", " V",
-    ]
-    
-    for suffix in suffixes:
-        if s.endswith(suffix):
-            s = s[:-len(suffix)]
-            break
+    # Remove common suffixes at end (after comma or space); the leftmost
+    # match is the longest, e.g. ", Jr." rather than " Jr."
+    s = _SUFFIX_RE.sub("", s, count=1)
     
     # Also remove if Jr/Sr appears mid-name (rare but happens)
     # "John Jr. Smith" -> "John Smith"
@@ -245,17 +298,7 @@ def remove_suffix(s: str) -> str:
     return s.strip()
 
 
-def normalize_nickname(name: str) -> str:
-    """
-    Normalize common nicknames to their formal equivalents.
-    
-    Examples:
-        "mike" -> "michael"
-        "nick" -> "nicholas"
-    """
-    return NICKNAME_MAP.get(name, name)
-
-
+@lru_cache(maxsize=None)
 def norm_name(s: str) -> str:
     """
     Normalize names for joining CTHRU with model data.
@@ -271,6 +314,8 @@ def norm_name(s: str) -> str:
     
     Note: We intentionally use a SIMPLE algorithm + manual overrides
     rather than complex heuristics. See NAME_MANUAL_MAP docstring for why.
+
+    Results are memoized, so each distinct name is only processed once.
     """
     s = (s or "").strip()
     
@@ -280,20 +325,17 @@ def norm_name(s: str) -> str:
     # Remove accents
     s = remove_accents(s)
     
-    # Lowercase and remove punctuation (but keep hyphens for now)
-    s = s.lower()
-    for ch in ",.''-–—":
-        s = s.replace(ch, " ")
-    s = " ".join(s.split())
+    # Lowercase and remove punctuation in a single pass
+    s = _PUNCT_RE.sub(" ", s.lower())
 
     # Apply nickname normalization to full string first
     parts = s.split()
-    normalized_parts = [normalize_nickname(p) for p in parts]
+    normalized_parts = list(map(NICKNAME_MAP.get, parts, parts))
     normalized_full = " ".join(normalized_parts)
     
     # Check manual override map
-    if normalized_full in NAME_MANUAL_MAP:
-        override = NAME_MANUAL_MAP[normalized_full]
+    override = NAME_MANUAL_MAP.get(normalized_full)
+    if override is not None:
         if override == "SKIP":
             return normalized_full  # Return as-is, won't match anything
         return override
@@ -317,10 +359,12 @@ def get_cache_path(url: str, year: int | None) -> Path:
     """Generate cache file path based on URL and year."""
     # Create a hash of the URL + year for the cache filename
     cache_key = f"{url}_{year}"
-    cache_hash = hashlib.md5(cache_key.encode()).hexdigest()[:12]
+    cache_hash = hashlib.blake2b(cache_key.encode(), digest_size=6).hexdigest()
     cache_dir = Path("data/cache/cthru")
     cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir / f"cthru_{year or 'all'}_{cache_hash}.csv"
+    # Parquet keeps column types and avoids re-parsing the CSV on warm runs
+    suffix = "parquet" if PYARROW_AVAILABLE else "csv"
+    return cache_dir / f"cthru_{year or 'all'}_{cache_hash}.{suffix}"
 
 
 def is_cache_valid(cache_path: Path, max_age_hours: int = 24) -> bool:
@@ -357,7 +401,10 @@ def fetch_cthru_data(
     cache_path = get_cache_path(url, year)
     if use_cache and is_cache_valid(cache_path):
         print(f"  Using cached CTHRU data from {cache_path}")
-        df = pd.read_csv(cache_path, encoding="utf-8")
+        if cache_path.suffix == ".parquet":
+            df = pd.read_parquet(cache_path)
+        else:
+            df = pd.read_csv(cache_path, encoding="utf-8")
         print(f"  Loaded {len(df)} cached records")
         return df
     
@@ -379,6 +426,15 @@ def fetch_cthru_data(
             if year:
                 params.append(f"year={year}")
             
+            # Only the Legislature rows and the columns we use
+            # (filter server-side instead of downloading the whole payroll)
+            params.append("$select=" + ",".join(CTHRU_COLUMNS))
+            where = " OR ".join(
+                f"upper(department_division) like '%{keyword}%'"
+                for keyword in LEGISLATURE_KEYWORDS
+            )
+            params.append("$where=" + urllib.parse.quote(where))
+
             # Request ALL records - no limit
             # (Socrata will return everything available)
             params.append("$limit=999999")
@@ -388,8 +444,15 @@ def fetch_cthru_data(
             
             print("  Fetching from Socrata (this may take 10-30 sec)...")
 
-            # Read CSV with pandas
-            df = pd.read_csv(fetch_url, encoding="utf-8")
+            # Read CSV with pandas (Arrow parser and string columns
+            # when pyarrow is installed)
+            if PYARROW_AVAILABLE:
+                df = pd.read_csv(
+                    fetch_url, encoding="utf-8",
+                    engine="pyarrow", dtype_backend="pyarrow",
+                )
+            else:
+                df = pd.read_csv(fetch_url, encoding="utf-8")
 
             # Check for required columns (actual CTHRU schema)
             required_cols = ["name_last", "name_first",
@@ -417,29 +480,15 @@ def fetch_cthru_data(
                 "pay_other_actual": "other_pay",
             })
 
-            print(f"  Fetched {len(df)} total CTHRU records")
+            # agency_name repeats a handful of values across every row; a
+            # categorical shrinks it and gives integer-coded groupby keys
+            df["agency_name"] = df["agency_name"].astype("category")
 
-            # Filter to Legislature - check multiple possible values
-            legislature_keywords = [
-                "LEGISLATURE", "HOUSE", "SENATE",
-                "GENERAL COURT", "REPRESENTATIVE"
-            ]
-            
-            # Create mask for any matching keyword
-            mask = df["agency_name"].str.upper().str.contains(
-                "|".join(legislature_keywords), na=False, regex=True
-            )
-            
-            if mask.sum() == 0:
-                # No matches found - print diagnostic info
+            print(f"  Fetched {len(df)} Legislature records")
+            if df.empty:
+                keywords = ", ".join(LEGISLATURE_KEYWORDS)
                 print("  Warning: No Legislature records found!")
-                print("  Sample department_division values:")
-                sample_depts = df["agency_name"].value_counts().head(10)
-                for dept, count in sample_depts.items():
-                    print(f"    - {dept} ({count} records)")
-            
-            df = df[mask]
-            print(f"  Filtered to {len(df)} Legislature records")
+                print(f"  (department_division matching: {keywords})")
 
             # Filter to specific year if provided
             if year and "calendar_year" in df.columns:
@@ -450,7 +499,10 @@ def fetch_cthru_data(
 
             # Cache the results
             if use_cache and len(df) > 0:
-                df.to_csv(cache_path, index=False, encoding="utf-8")
+                if cache_path.suffix == ".parquet":
+                    df.to_parquet(cache_path, index=False, compression="zstd")
+                else:
+                    df.to_csv(cache_path, index=False, encoding="utf-8")
                 print(f"  Cached {len(df)} records to {cache_path}")
 
             return df
@@ -484,7 +536,9 @@ def aggregate_cthru_by_person(
         - df_agencies: aggregated by employee_name + calendar_year
           + agency_name
     """
-    # Ensure numeric columns exist and are numeric
+    # Ensure numeric columns exist and are numeric (unparseable cells
+    # become 0; casting to float64 first turns Arrow-backed NaN into a
+    # missing value that fillna sees)
     pay_cols = ["regular_pay", "other_pay", "total_pay"]
     for col in pay_cols:
         if col not in df_raw.columns:
@@ -492,12 +546,25 @@ def aggregate_cthru_by_person(
         else:
             df_raw[col] = pd.to_numeric(
                 df_raw[col], errors="coerce"
-            ).fillna(0.0)
+            ).astype("float64").fillna(0.0)
 
-    # Aggregate by person + year
-    df_person = (
+    # Aggregate by person + year + agency once over the raw rows
+    df_by_agency = (
         df_raw.groupby(
-            ["employee_name", "calendar_year"], as_index=False
+            ["employee_name", "calendar_year", "agency_name"],
+            as_index=False, observed=True, dropna=False,
+        )
+        .agg({
+            "regular_pay": "sum",
+            "other_pay": "sum",
+            "total_pay": "sum",
+        })
+    )
+
+    # Aggregate by person + year from the (much smaller) agency table
+    df_person = (
+        df_by_agency.groupby(
+            ["employee_name", "calendar_year"], as_index=False, observed=True
         )
         .agg({
             "regular_pay": "sum",
@@ -507,37 +574,40 @@ def aggregate_cthru_by_person(
     )
 
     # Auxiliary table: agency-level aggregation (to detect
-    # split-year records)
+    # split-year records). Rows without an agency are only kept above
+    # (dropna=False) so their pay still reaches df_person
+    agency_keys = ["employee_name", "calendar_year", "agency_name"]
     df_agencies = (
-        df_raw.groupby(
-            ["employee_name", "calendar_year", "agency_name"],
-            as_index=False
-        )
-        .agg({"total_pay": "sum"})
+        df_by_agency.dropna(subset=agency_keys)[agency_keys + ["total_pay"]]
+        .reset_index(drop=True)
     )
 
     return df_person, df_agencies
 
 
-def build_agency_summary(df_agencies: pd.DataFrame) -> dict[str, str]:
+def build_agency_summary(df_agencies: pd.DataFrame) -> pd.DataFrame:
     """
     Build a summary of agencies per employee for display.
 
+    Args:
+        df_agencies: Agency-level aggregation from aggregate_cthru_by_person
+
     Returns:
-        Dict mapping employee_name to summary like
-        "House($72,331); Senate($42,774)"
+        DataFrame indexed by employee_name with agencies_summary (like
+        "House($72,331); Senate($42,774)") and agency_count columns,
+        both computed in a single groupby pass
     """
-    summary_map = {}
-
-    for employee_name, group in df_agencies.groupby("employee_name"):
-        parts = []
-        for _, row in group.iterrows():
-            agency = row["agency_name"]
-            amount = row["total_pay"]
-            parts.append(f"{agency}(${amount:,.0f})")
-        summary_map[employee_name] = "; ".join(parts)
-
-    return summary_map
+    parts = pd.DataFrame({
+        "part": (
+            df_agencies["agency_name"].astype(str) + "($"
+            + df_agencies["total_pay"].map("{:,.0f}".format) + ")"
+        ),
+        "agency_name": df_agencies["agency_name"],
+    })
+    return parts.groupby(df_agencies["employee_name"], observed=True).agg(
+        agencies_summary=("part", "; ".join),
+        agency_count=("agency_name", "nunique"),
+    )
 
 
 def infer_year_from_csv(csv_path: str) -> int:
@@ -560,66 +630,122 @@ def infer_year_from_csv(csv_path: str) -> int:
     return datetime.now().year
 
 
-def compute_variance_status(
-    variance: float,
-    cthru_total: float,
-    model_total: float,
-    agency_count: int,
-    role_stipends_total: float = 0,
-) -> str:
+def compute_variance_statuses(df: pd.DataFrame) -> np.ndarray:
     """
-    Determine variance status bucket using transparent,
+    Determine variance status buckets using transparent,
     audit-friendly rules.
 
     Enhanced to detect annualization patterns and specific investigation
-    tiers for better prioritization.
+    tiers for better prioritization. The rules are evaluated column-wide:
+    np.select picks the first matching condition for each row.
 
     Args:
-        variance: model_total - cthru_total
-        cthru_total: Total compensation from CTHRU
-        model_total: Total compensation from model (annualized)
-        agency_count: Number of distinct agencies employee appears in
-        role_stipends_total: Total leadership/committee stipends
+        df: Frame with variance (model_total - cthru_total), cthru_total,
+            total_comp (annualized model total) and agency_count columns
+            (role_stipends_total is optional, defaulting to 0)
 
     Returns:
-        Status string: OK, PARTIAL_OR_ROLE_CHANGE, LIKELY_ANNUALIZED,
-        INVESTIGATE_PARTIAL_YEAR, INVESTIGATE_LEADERSHIP,
+        Array of status strings, one per row: OK, PARTIAL_OR_ROLE_CHANGE,
+        LIKELY_ANNUALIZED, INVESTIGATE_PARTIAL_YEAR, INVESTIGATE_LEADERSHIP,
         INVESTIGATE_OVERPAYMENT, INVESTIGATE, or NO_MATCH
     """
-    abs_var = abs(variance)
-
-    if cthru_total == 0:
-        return "NO_MATCH"
-    elif abs_var < THRESHOLD_OK:
-        return "OK"
-    elif abs_var < THRESHOLD_PARTIAL or agency_count > 1:
-        return "PARTIAL_OR_ROLE_CHANGE"
-    else:
-        # Large variance (≥ $10k) - check patterns
-        cthru_pct = (cthru_total / model_total) * 100 if model_total > 0 else 0
+    def column(name: str, default: float = 0.0) -> np.ndarray:
+        if name not in df.columns:
+            return np.full(len(df), default)
+        return df[name].to_numpy(dtype=float, na_value=np.nan)
+
+    variance = column("variance")
+    cthru_total = column("cthru_total")
+    model_total = column("total_comp")
+    agency_count = column("agency_count")
+    role_stipends_total = column("role_stipends_total")
+
+    abs_var = np.abs(variance)
+    cthru_ratio = np.zeros_like(cthru_total)
+    np.divide(
+        cthru_total, model_total, out=cthru_ratio, where=model_total > 0
+    )
+    cthru_pct = cthru_ratio * 100
+
+    conditions = [
+        cthru_total == 0,
+        abs_var < THRESHOLD_OK,
+        (abs_var < THRESHOLD_PARTIAL) | (agency_count > 1),
+        (cthru_pct >= ANNUALIZATION_MIN_PCT)
+        & (cthru_pct <= ANNUALIZATION_MAX_PCT),
+        cthru_pct < PARTIAL_YEAR_THRESHOLD,
+        cthru_pct > OVERPAYMENT_THRESHOLD,
+        (role_stipends_total >= HIGH_LEADERSHIP_STIPEND)
+        & (cthru_pct >= LEADERSHIP_HIGH_THRESHOLD)
+        & (cthru_pct < LEADERSHIP_LOW_THRESHOLD),
+    ]
+    # Select small integer codes, then map them to labels in one gather
+    codes = np.select(
+        conditions,
+        np.arange(len(conditions), dtype=np.int8),
+        default=np.int8(len(conditions)),
+    )
+    return _VARIANCE_STATUS_LABELS[codes]
 
-        # If CTHRU is 75-90% of model, likely partial year rather than error
-        if ANNUALIZATION_MIN_PCT <= cthru_pct <= ANNUALIZATION_MAX_PCT:
-            return "LIKELY_ANNUALIZED"
 
-        # Tier 1: Very low CTHRU (< 50%) - likely mid-year appointment/data issue
-        elif cthru_pct < PARTIAL_YEAR_THRESHOLD:
-            return "INVESTIGATE_PARTIAL_YEAR"
+def compute_explanations(df: pd.DataFrame) -> pd.Series:
+    """
+    Human-readable explanation for each row's status.
 
-        # Tier 2: Overpayment (CTHRU > 110%) - payment timing issue
-        elif cthru_pct > OVERPAYMENT_THRESHOLD:
-            return "INVESTIGATE_OVERPAYMENT"
+    Fixed messages come straight from the status; the rest interpolate
+    percentages formatted column-wide rather than row by row.
 
-        # Tier 3: High leadership with 60-75% CTHRU - irregular payment schedule
-        elif (
-            role_stipends_total >= HIGH_LEADERSHIP_STIPEND
-            and LEADERSHIP_HIGH_THRESHOLD <= cthru_pct < LEADERSHIP_LOW_THRESHOLD
-        ):
-            return "INVESTIGATE_LEADERSHIP"
+    Args:
+        df: Frame with status, cthru_pct_of_model and months_equivalent
+            columns (role_stipends_total is optional, defaulting to 0)
 
-        # Everything else
-        else:
-            return "INVESTIGATE"
+    Returns:
+        Series of explanation strings aligned with df
+    """
+    status = df["status"].to_numpy()
+    pct = df["cthru_pct_of_model"].map("{:.0f}".format).astype(str)
+    months = df["months_equivalent"].map("{:.1f}".format).astype(str)
+    if "role_stipends_total" in df.columns:
+        leadership = (
+            df["role_stipends_total"].map("{:,.0f}".format).astype(str)
+        )
+    else:
+        leadership = "0"
+
+    messages = {
+        "OK": "Within acceptable variance range",
+        "PARTIAL_OR_ROLE_CHANGE": (
+            "Partial year, role change, or multi-agency employment"
+        ),
+        "NO_MATCH": "No CTHRU record found",
+        "LIKELY_ANNUALIZED": (
+            "Likely annualization: " + months
+            + " months paid vs 12-month model"
+        ),
+        "INVESTIGATE_PARTIAL_YEAR": (
+            "🔴 HIGH PRIORITY: Very low CTHRU (" + pct
+            + "%) - likely mid-year appointment or data issue"
+        ),
+        "INVESTIGATE_OVERPAYMENT": (
+            "⚠️ MEDIUM PRIORITY: CTHRU exceeds model (" + pct
+            + "%) - check payment timing or multi-year adjustment"
+        ),
+        "INVESTIGATE_LEADERSHIP": (
+            "⚠️ MEDIUM PRIORITY: High leadership stipends ($" + leadership
+            + ") at " + pct + "% - likely irregular payment schedule"
+        ),
+    }
+    # INVESTIGATE (catch-all)
+    default = (
+        "🔍 REVIEW NEEDED: Unexplained variance (" + pct
+        + "% of model) - requires investigation"
+    )
+    explanations = np.select(
+        [status == label for label in messages],
+        [np.asarray(message, dtype=object) for message in messages.values()],
+        default=default.to_numpy(dtype=object),
+    )
+    return pd.Series(explanations, index=df.index, dtype=object)
 
 
 def run_cthru_validation(
@@ -676,16 +802,6 @@ def run_cthru_validation(
     df_cthru, df_agencies = aggregate_cthru_by_person(df_raw)
     print(f"  Aggregated to {len(df_cthru)} unique employees")
 
-    # Build agency summary map
-    agency_summary_map = build_agency_summary(df_agencies)
-
-    # Count agencies per employee
-    agency_counts = (
-        df_agencies.groupby("employee_name")["agency_name"]
-        .nunique()
-        .to_dict()
-    )
-
     # 4. Read model data
     print("\n[3/4] Loading model data...")
     df_model = pd.read_csv(members_csv_path)
@@ -693,12 +809,17 @@ def run_cthru_validation(
 
     # 5. Normalize names for joining
     print("\n[4/4] Joining and computing variances...")
-    df_model["norm"] = df_model["name"].apply(norm_name)
-    df_cthru["norm"] = df_cthru["employee_name"].apply(norm_name)
+    df_model["norm"] = df_model["name"].map(norm_name)
+    df_cthru["norm"] = df_cthru["employee_name"].map(norm_name)
 
-    # 6. Left join model to CTHRU
+    agency_summary = build_agency_summary(df_agencies)
+
+    # 6. Left join model to CTHRU (employee_name is carried along so the
+    # agency breakdown is looked up per CTHRU employee, not per join key)
     df = df_model.merge(
-        df_cthru[["norm", "regular_pay", "other_pay", "total_pay"]],
+        df_cthru[[
+            "norm", "employee_name", "regular_pay", "other_pay", "total_pay",
+        ]],
         on="norm",
         how="left",
         suffixes=("_model", "_cthru"),
@@ -709,65 +830,38 @@ def run_cthru_validation(
     df["regular_pay"] = df["regular_pay"].fillna(0.0)
     df["other_pay"] = df["other_pay"].fillna(0.0)
     df["variance"] = df["total_comp"] - df["cthru_total"]
-    df["pct_diff"] = 100 * df["variance"] / df["cthru_total"].replace(
-        0, 1
+    cthru_total = df["cthru_total"].to_numpy(dtype=float)
+    model_total = df["total_comp"].to_numpy(dtype=float)
+    # Unmatched rows (no CTHRU pay) are taken relative to $1
+    df["pct_diff"] = (
+        100 * df["variance"].to_numpy(dtype=float)
+        / np.where(cthru_total == 0, 1.0, cthru_total)
     )
     
-    # Add annualization metrics
-    df["cthru_pct_of_model"] = (
-        df["cthru_total"] / df["total_comp"]
-    ).replace([float('inf'), -float('inf')], 0) * 100
-    df["months_equivalent"] = (
-        df["cthru_total"] / df["total_comp"]
-    ).replace([float('inf'), -float('inf')], 0) * 12
+    # Add annualization metrics (0 where the model total is 0)
+    cthru_ratio = np.zeros_like(cthru_total)
+    np.divide(
+        cthru_total, model_total, out=cthru_ratio, where=model_total != 0
+    )
+    df["cthru_pct_of_model"] = cthru_ratio * 100
+    df["months_equivalent"] = cthru_ratio * 12
 
     # Add agency summary
-    df["agencies_summary"] = df["name"].apply(
-        lambda name: agency_summary_map.get(norm_name(name), "")
+    employee_name = df.pop("employee_name")
+    df["agencies_summary"] = (
+        employee_name.map(agency_summary["agencies_summary"]).fillna("")
     )
 
     # Add agency count for status bucketing
-    df["agency_count"] = df["name"].apply(
-        lambda name: agency_counts.get(norm_name(name), 0)
+    df["agency_count"] = (
+        employee_name.map(agency_summary["agency_count"]).fillna(0).astype(int)
     )
 
     # Compute status
-    df["status"] = df.apply(
-        lambda row: compute_variance_status(
-            row["variance"],
-            row["cthru_total"],
-            row["total_comp"],
-            row["agency_count"],
-            row.get("role_stipends_total", 0),
-        ),
-        axis=1,
-    )
+    df["status"] = compute_variance_statuses(df)
 
     # 8. Add human-readable explanations
-    def generate_explanation(row):
-        status = row["status"]
-        pct = row["cthru_pct_of_model"]
-        months = row["months_equivalent"]
-
-        if status == "OK":
-            return "Within acceptable variance range"
-        elif status == "PARTIAL_OR_ROLE_CHANGE":
-            return "Partial year, role change, or multi-agency employment"
-        elif status == "NO_MATCH":
-            return "No CTHRU record found"
-        elif status == "LIKELY_ANNUALIZED":
-            return f"Likely annualization: {months:.1f} months paid vs 12-month model"
-        elif status == "INVESTIGATE_PARTIAL_YEAR":
-            return f"🔴 HIGH PRIORITY: Very low CTHRU ({pct:.0f}%) - likely mid-year appointment or data issue"
-        elif status == "INVESTIGATE_OVERPAYMENT":
-            return f"⚠️ MEDIUM PRIORITY: CTHRU exceeds model ({pct:.0f}%) - check payment timing or multi-year adjustment"
-        elif status == "INVESTIGATE_LEADERSHIP":
-            leadership = row.get("role_stipends_total", 0)
-            return f"⚠️ MEDIUM PRIORITY: High leadership stipends (${leadership:,.0f}) at {pct:.0f}% - likely irregular payment schedule"
-        else:  # INVESTIGATE (catch-all)
-            return f"🔍 REVIEW NEEDED: Unexplained variance ({pct:.0f}% of model) - requires investigation"
-    
-    df["explanation"] = df.apply(generate_explanation, axis=1)
+    df["explanation"] = compute_explanations(df)
     
     # 9. Export variance details CSV
     output_cols = [
@@ -802,14 +896,20 @@ def run_cthru_validation(
     df_outliers = df.nlargest(10, "variance", keep="all")[
         ["name", "variance", "status", "agencies_summary"]
     ]
-    top_outliers = []
-    for _, row in df_outliers.iterrows():
-        top_outliers.append({
-            "name": row["name"],
-            "variance": float(row["variance"]),
-            "status": row["status"],
-            "notes": row["agencies_summary"] or "No agency split",
-        })
+    top_outliers = [
+        {
+            "name": name,
+            "variance": float(variance),
+            "status": status,
+            "notes": notes or "No agency split",
+        }
+        for name, variance, status, notes in zip(
+            df_outliers["name"],
+            df_outliers["variance"],
+            df_outliers["status"],
+            df_outliers["agencies_summary"],
+        )
+    ]
 
     # 11. Chamber and role breakdowns
     variance_by_chamber = {}
@@ -826,9 +926,12 @@ def run_cthru_validation(
         "with_leadership": {},
         "no_leadership": {},
     }
-    for has_leadership, label in [(True, "with_leadership"), (False, "no_leadership")]:
-        role_df = df[df.get("has_stipend", False) == has_leadership] if "has_stipend" in df.columns else pd.DataFrame()
-        if len(role_df) > 0:
+    role_labels = {True: "with_leadership", False: "no_leadership"}
+    if "has_stipend" in df.columns:
+        for has_leadership, role_df in df.groupby("has_stipend"):
+            label = role_labels.get(has_leadership)
+            if label is None:
+                continue
             variance_by_role[label] = {
                 "count": int(len(role_df)),
                 "status_counts": role_df["status"].value_counts().to_dict(),
@@ -836,13 +939,14 @@ def run_cthru_validation(
             }
     
     # Annualization analysis
-    investigate_df = df[df["status"] == "INVESTIGATE"]
-    annualized_df = df[df["status"] == "LIKELY_ANNUALIZED"]
+    median_months = float(df["months_equivalent"].median())
     annualization_analysis = {
-        "likely_annualized_count": int(len(annualized_df)),
+        "likely_annualized_count": int(
+            (df["status"] == "LIKELY_ANNUALIZED").sum()
+        ),
         "median_cthru_pct_all": float(df["cthru_pct_of_model"].median()),
-        "median_months_equivalent": float(df["months_equivalent"].median()),
-        "hypothesis": f"Median {df['months_equivalent'].median():.1f} months suggests partial year (CTHRU through Oct vs 12-month model)",
+        "median_months_equivalent": median_months,
+        "hypothesis": f"Median {median_months:.1f} months suggests partial year (CTHRU through Oct vs 12-month model)",
     }
     
     # 12. Build summary JSON
@@ -896,8 +1000,14 @@ def run_cthru_validation(
     }
 
     summary_path = "out/cthru_summary.json"
-    with open(summary_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    if ORJSON_AVAILABLE:
+        Path(summary_path).write_bytes(orjson.dumps(
+            summary,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        ))
+    else:
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
     print(f"  ✓ Wrote {summary_path}")
 
     # 11. Print summary to console
@@ -11,18 +11,34 @@ This script helps determine:
 import pandas as pd
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Absolute-variance bucket edges (lower edge inclusive) and their labels
+VARIANCE_BUCKET_EDGES = [15000, 20000, 30000, 50000]
+VARIANCE_BUCKET_LABELS = np.array([
+    "10k-15k (minor)", "15k-20k", "20k-30k", "30k-50k", "50k+ (major)",
+], dtype=object)
+
+# The only members.csv columns merged onto the variances
+MEMBERS_COLUMNS = ["member_id", "party", "has_stipend", "role_1", "role_2"]
+
 
 def load_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Load variance and members data."""
     df_variance = pd.read_csv("out/cthru_variances.csv")
-    df_members = pd.read_csv("out/members.csv")
+    df_members = pd.read_csv("out/members.csv", usecols=MEMBERS_COLUMNS)
     
     # Merge to get additional context
     df = df_variance.merge(
-        df_members[["member_id", "party", "has_stipend", "role_1", "role_2"]],
+        df_members[MEMBERS_COLUMNS],
         on="member_id",
         how="left"
     )
@@ -39,14 +55,28 @@ def calculate_cthru_percentage(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def analyze_annualization_hypothesis(df: pd.DataFrame) -> Dict:
+def select_investigate(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Select the INVESTIGATE cases every analysis below works on.
+
+    main() selects them once and passes the subset to each analysis; the
+    analyses only read it, so it is safe to share without a defensive copy
+    (boolean selection already returns a new frame).
+    """
+    return df[df["status"].to_numpy() == "INVESTIGATE"]
+
+
+def analyze_annualization_hypothesis(
+    df: pd.DataFrame, investigate: Optional[pd.DataFrame] = None
+) -> Dict:
     """
     Test hypothesis: Are most INVESTIGATE cases due to annualization?
     
     CTHRU data through Oct 18, 2025 = ~10.5 months
     Expected ratio: 10.5/12 = 87.5%
     """
-    investigate = df[df["status"] == "INVESTIGATE"].copy()
+    if investigate is None:
+        investigate = select_investigate(df)
     
     # Count cases where CTHRU is 75-90% of model (likely partial year)
     partial_year_mask = (investigate["cthru_pct_of_model"] >= 75) & \
@@ -56,6 +86,11 @@ def analyze_annualization_hypothesis(df: pd.DataFrame) -> Dict:
     # Count cases where CTHRU > model (negative variance)
     negative_variance = (investigate["variance"] < 0).sum()
     
+    # All four percentiles from a single quantile call
+    p25, p50, p75, p90 = investigate["cthru_pct_of_model"].quantile(
+        [0.25, 0.50, 0.75, 0.90]
+    ).to_numpy()
+    
     analysis = {
         "total_investigate": len(investigate),
         "likely_partial_year": int(partial_year_count),
@@ -65,38 +100,34 @@ def analyze_annualization_hypothesis(df: pd.DataFrame) -> Dict:
         "mean_cthru_pct": float(investigate["cthru_pct_of_model"].mean()),
         "median_months_equiv": float(investigate["months_equivalent"].median()),
         "percentiles": {
-            "p25": float(investigate["cthru_pct_of_model"].quantile(0.25)),
-            "p50": float(investigate["cthru_pct_of_model"].quantile(0.50)),
-            "p75": float(investigate["cthru_pct_of_model"].quantile(0.75)),
-            "p90": float(investigate["cthru_pct_of_model"].quantile(0.90)),
+            "p25": float(p25),
+            "p50": float(p50),
+            "p75": float(p75),
+            "p90": float(p90),
         }
     }
     
     return analysis
 
 
-def analyze_by_variance_range(df: pd.DataFrame) -> pd.DataFrame:
+def analyze_by_variance_range(
+    df: pd.DataFrame, investigate: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
     """Group INVESTIGATE cases by variance range."""
-    investigate = df[df["status"] == "INVESTIGATE"].copy()
-    
-    # Define ranges
-    def variance_bucket(var):
-        abs_var = abs(var)
-        if abs_var < 15000:
-            return "10k-15k (minor)"
-        elif abs_var < 20000:
-            return "15k-20k"
-        elif abs_var < 30000:
-            return "20k-30k"
-        elif abs_var < 50000:
-            return "30k-50k"
-        else:
-            return "50k+ (major)"
-    
-    investigate["variance_bucket"] = investigate["variance"].apply(variance_bucket)
+    if investigate is None:
+        investigate = select_investigate(df)
+    
+    # Bucket by absolute variance in one pass (NaN lands in the top bucket)
+    bucket_idx = np.digitize(
+        investigate["abs_variance"].to_numpy(), VARIANCE_BUCKET_EDGES
+    )
+    variance_bucket = pd.Series(
+        VARIANCE_BUCKET_LABELS[bucket_idx],
+        index=investigate.index, name="variance_bucket",
+    )
     
     # Summary by bucket
-    summary = investigate.groupby("variance_bucket").agg({
+    summary = investigate.groupby(variance_bucket).agg({
         "member_id": "count",
         "variance": ["mean", "median"],
         "cthru_pct_of_model": ["mean", "median"],
@@ -109,13 +140,16 @@ def analyze_by_variance_range(df: pd.DataFrame) -> pd.DataFrame:
     return summary
 
 
-def analyze_by_chamber(df: pd.DataFrame) -> Dict:
+def analyze_by_chamber(
+    df: pd.DataFrame, investigate: Optional[pd.DataFrame] = None
+) -> Dict:
     """Compare variance patterns between House and Senate."""
-    investigate = df[df["status"] == "INVESTIGATE"].copy()
+    if investigate is None:
+        investigate = select_investigate(df)
     
     analysis = {}
     for chamber in ["House", "Senate"]:
-        chamber_data = investigate[investigate["chamber"] == chamber]
+        chamber_data = investigate[investigate["chamber"].to_numpy() == chamber]
         if len(chamber_data) > 0:
             analysis[chamber] = {
                 "count": int(len(chamber_data)),
@@ -127,14 +161,17 @@ def analyze_by_chamber(df: pd.DataFrame) -> Dict:
     return analysis
 
 
-def analyze_by_leadership(df: pd.DataFrame) -> Dict:
+def analyze_by_leadership(
+    df: pd.DataFrame, investigate: Optional[pd.DataFrame] = None
+) -> Dict:
     """Compare members with and without leadership roles."""
-    investigate = df[df["status"] == "INVESTIGATE"].copy()
+    if investigate is None:
+        investigate = select_investigate(df)
     
     # Split by leadership (has_stipend indicates leadership/committee roles)
     analysis = {}
     for has_leadership, label in [(True, "with_leadership"), (False, "no_leadership")]:
-        subset = investigate[investigate["has_stipend"] == has_leadership]
+        subset = investigate[investigate["has_stipend"].to_numpy() == has_leadership]
         if len(subset) > 0:
             analysis[label] = {
                 "count": int(len(subset)),
@@ -146,74 +183,78 @@ def analyze_by_leadership(df: pd.DataFrame) -> Dict:
     return analysis
 
 
-def identify_top_outliers(df: pd.DataFrame, n: int = 20) -> pd.DataFrame:
+def identify_top_outliers(
+    df: pd.DataFrame, n: int = 20,
+    investigate: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
     """Get top N outliers by absolute variance with explanations."""
-    investigate = df[df["status"] == "INVESTIGATE"].copy()
+    if investigate is None:
+        investigate = select_investigate(df)
     
-    # Sort by absolute variance
-    top = investigate.nlargest(n, "abs_variance")[[
+    # Rank on the variance column alone, then gather just the top rows
+    top_rows = investigate["abs_variance"].reset_index(drop=True).nlargest(n).index
+    top = investigate.iloc[top_rows][[
         "name", "chamber", "variance", "total_comp", "cthru_total", 
         "cthru_pct_of_model", "months_equivalent", "role_stipends_total",
         "role_1", "role_2"
-    ]].copy()
-    
-    # Generate explanations
-    def explain(row):
-        explanations = []
-        
-        pct = row["cthru_pct_of_model"]
-        months = row["months_equivalent"]
-        
-        if pct < 50:
-            explanations.append("⚠️ Very low CTHRU (< 50% of model) - likely partial year or data issue")
-        elif 75 <= pct <= 90:
-            explanations.append(f"🕐 Likely annualization ({months:.1f} months paid vs 12-month model)")
-        elif pct > 100:
-            explanations.append("⚠️ CTHRU > Model (negative variance) - possible multi-year payment or role change")
-        else:
-            explanations.append(f"❓ Unusual pattern ({pct:.0f}% of model)")
-        
-        if row["role_stipends_total"] > 20000:
-            explanations.append(f"💰 High leadership stipends (${row['role_stipends_total']:,.0f}) - may be paid irregularly")
-        
-        return " | ".join(explanations)
-    
-    top["explanation"] = top.apply(explain, axis=1)
+    ]]
+    
+    # Generate explanations: a pattern note, plus a stipend note when large
+    pct = top["cthru_pct_of_model"]
+    months_str = top["months_equivalent"].map("{:.1f}".format).astype(str)
+    pct_str = pct.map("{:.0f}".format).astype(str)
+    pattern = np.select(
+        [pct < 50, (pct >= 75) & (pct <= 90), pct > 100],
+        [
+            np.asarray("⚠️ Very low CTHRU (< 50% of model) - likely partial year or data issue", dtype=object),
+            ("🕐 Likely annualization (" + months_str + " months paid vs 12-month model)").to_numpy(dtype=object),
+            np.asarray("⚠️ CTHRU > Model (negative variance) - possible multi-year payment or role change", dtype=object),
+        ],
+        default=("❓ Unusual pattern (" + pct_str + "% of model)").to_numpy(dtype=object),
+    )
+    
+    stipends = top["role_stipends_total"]
+    stipend_str = stipends.map("{:,.0f}".format).astype(str)
+    stipend_note = np.where(
+        stipends > 20000,
+        " | 💰 High leadership stipends ($" + stipend_str + ") - may be paid irregularly",
+        "",
+    )
+    
+    top["explanation"] = pattern + stipend_note
     
     return top
 
 
-def generate_enhanced_status_recommendations(df: pd.DataFrame) -> Dict:
+def generate_enhanced_status_recommendations(
+    df: pd.DataFrame, investigate: Optional[pd.DataFrame] = None
+) -> Dict:
     """
     Propose new status categories to reduce false positives.
     """
-    investigate = df[df["status"] == "INVESTIGATE"].copy()
-    
-    # Simulate new categorization
-    def new_status(row):
-        abs_var = abs(row["variance"])
-        pct = row["cthru_pct_of_model"]
-        
-        # LIKELY_ANNUALIZED: variance >= 10k BUT CTHRU is 75-90% of model
-        if abs_var >= 10000 and 75 <= pct <= 90:
-            return "LIKELY_ANNUALIZED"
-        
-        # LIKELY_ANNUALIZED_MINOR: variance 10k-15k and within annualization range
-        elif 10000 <= abs_var < 15000:
-            return "LIKELY_ANNUALIZED_MINOR"
-        
-        # PAYMENT_TIMING: CTHRU > model (negative variance) within reasonable range
-        elif row["variance"] < 0 and abs_var < 30000:
-            return "PAYMENT_TIMING_ISSUE"
-        
+    if investigate is None:
+        investigate = select_investigate(df)
+    
+    # Simulate new categorization (first matching rule wins)
+    variance = investigate["variance"].to_numpy(dtype=float)
+    abs_var = np.abs(variance)
+    pct = investigate["cthru_pct_of_model"].to_numpy(dtype=float)
+    proposed_status = pd.Series(np.select(
+        [
+            # LIKELY_ANNUALIZED: variance >= 10k BUT CTHRU is 75-90% of model
+            (abs_var >= 10000) & (pct >= 75) & (pct <= 90),
+            # LIKELY_ANNUALIZED_MINOR: variance 10k-15k and within annualization range
+            (abs_var >= 10000) & (abs_var < 15000),
+            # PAYMENT_TIMING: CTHRU > model (negative variance) within reasonable range
+            (variance < 0) & (abs_var < 30000),
+        ],
+        ["LIKELY_ANNUALIZED", "LIKELY_ANNUALIZED_MINOR", "PAYMENT_TIMING_ISSUE"],
         # TRUE_INVESTIGATE: Still needs investigation
-        else:
-            return "TRUE_INVESTIGATE"
-    
-    investigate["proposed_status"] = investigate.apply(new_status, axis=1)
+        default="TRUE_INVESTIGATE",
+    ), dtype=object)
     
     # Count new categories
-    new_counts = investigate["proposed_status"].value_counts().to_dict()
+    new_counts = proposed_status.value_counts().to_dict()
     
     recommendations = {
         "current_investigate_count": int(len(investigate)),
@@ -226,37 +267,32 @@ def generate_enhanced_status_recommendations(df: pd.DataFrame) -> Dict:
 
 
 def save_enhanced_variance_csv(df: pd.DataFrame):
-    """Save enhanced variance CSV with new columns."""
-    # Add computed columns
-    df["cthru_pct_of_model"] = (df["cthru_total"] / df["total_comp"]) * 100
-    df["months_equivalent"] = (df["cthru_total"] / df["total_comp"]) * 12
+    """
+    Save enhanced variance CSV with new columns.
     
-    # Generate explanation for each row
-    def generate_explanation(row):
-        if row["status"] == "OK":
-            return "Within acceptable variance range"
-        elif row["status"] == "PARTIAL_OR_ROLE_CHANGE":
-            return "Partial year, role change, or multi-agency employment"
-        elif row["status"] == "NO_MATCH":
-            return "No CTHRU record found"
-        else:
-            # INVESTIGATE - provide specific explanation
-            pct = row["cthru_pct_of_model"]
-            months = row["months_equivalent"]
-            abs_var = abs(row["variance"])
-            
-            if 75 <= pct <= 90:
-                return f"Likely annualization: {months:.1f} months paid vs 12-month model"
-            elif pct < 50:
-                return f"Very low CTHRU ({pct:.0f}% of model) - partial year or data issue"
-            elif pct > 110:
-                return f"CTHRU exceeds model ({pct:.0f}%) - possible payment timing or role change"
-            elif row["role_stipends_total"] > 30000 and abs_var < 20000:
-                return "Leadership stipends may be paid irregularly"
-            else:
-                return "Large unexplained variance - requires investigation"
-    
-    df["explanation"] = df.apply(generate_explanation, axis=1)
+    Expects the derived columns from calculate_cthru_percentage.
+    """
+    # Generate explanation for each row (first matching rule wins)
+    status = df["status"].to_numpy()
+    pct = df["cthru_pct_of_model"]
+    abs_var = df["abs_variance"]
+    pct_str = pct.map("{:.0f}".format).astype(str)
+    months_str = df["months_equivalent"].map("{:.1f}".format).astype(str)
+    explanations = [
+        (status == "OK", "Within acceptable variance range"),
+        (status == "PARTIAL_OR_ROLE_CHANGE", "Partial year, role change, or multi-agency employment"),
+        (status == "NO_MATCH", "No CTHRU record found"),
+        # INVESTIGATE - provide specific explanation
+        ((pct >= 75) & (pct <= 90), "Likely annualization: " + months_str + " months paid vs 12-month model"),
+        (pct < 50, "Very low CTHRU (" + pct_str + "% of model) - partial year or data issue"),
+        (pct > 110, "CTHRU exceeds model (" + pct_str + "%) - possible payment timing or role change"),
+        ((df["role_stipends_total"] > 30000) & (abs_var < 20000), "Leadership stipends may be paid irregularly"),
+    ]
+    df["explanation"] = np.select(
+        [np.asarray(condition) for condition, _ in explanations],
+        [np.asarray(text, dtype=object) for _, text in explanations],
+        default="Large unexplained variance - requires investigation",
+    )
     
     # Reorder columns to put new ones after pct_diff
     cols = df.columns.tolist()
@@ -292,11 +328,12 @@ def main():
     print("\n[1/7] Loading data...")
     df, df_members = load_data()
     df = calculate_cthru_percentage(df)
+    investigate = select_investigate(df)
     print(f"  Loaded {len(df)} records")
     
     # Annualization analysis
     print("\n[2/7] Analyzing annualization hypothesis...")
-    annualization = analyze_annualization_hypothesis(df)
+    annualization = analyze_annualization_hypothesis(df, investigate)
     print(f"  Total INVESTIGATE cases: {annualization['total_investigate']}")
     print(f"  Likely partial year (75-90% of model): {annualization['likely_partial_year']} ({annualization['likely_partial_year_pct']:.1f}%)")
     print(f"  Median CTHRU %: {annualization['median_cthru_pct']:.1f}%")
@@ -304,29 +341,31 @@ def main():
     
     # Variance range analysis
     print("\n[3/7] Analyzing by variance range...")
-    variance_ranges = analyze_by_variance_range(df)
+    variance_ranges = analyze_by_variance_range(df, investigate)
     print(variance_ranges.to_string())
     
     # Chamber analysis
     print("\n[4/7] Analyzing by chamber...")
-    chamber_analysis = analyze_by_chamber(df)
+    chamber_analysis = analyze_by_chamber(df, investigate)
     for chamber, stats in chamber_analysis.items():
         print(f"  {chamber}: {stats['count']} cases, median variance ${stats['median_variance']:,.0f}, CTHRU {stats['median_cthru_pct']:.1f}%")
     
     # Leadership analysis
     print("\n[5/7] Analyzing by leadership status...")
-    leadership_analysis = analyze_by_leadership(df)
+    leadership_analysis = analyze_by_leadership(df, investigate)
     for label, stats in leadership_analysis.items():
         print(f"  {label}: {stats['count']} cases, median variance ${stats['median_variance']:,.0f}, CTHRU {stats['median_cthru_pct']:.1f}%")
     
     # Top outliers
     print("\n[6/7] Identifying top 20 outliers...")
-    top_outliers = identify_top_outliers(df, n=20)
+    top_outliers = identify_top_outliers(df, n=20, investigate=investigate)
     print(f"  Generated explanations for top {len(top_outliers)} cases")
     
     # Enhanced status recommendations
     print("\n[7/7] Generating status recommendations...")
-    recommendations = generate_enhanced_status_recommendations(df)
+    recommendations = generate_enhanced_status_recommendations(
+        df, investigate
+    )
     print(f"  Current INVESTIGATE count: {recommendations['current_investigate_count']}")
     print(f"  Proposed TRUE_INVESTIGATE count: {recommendations['reduction_in_investigate']}")
     print(f"  Reduction: {recommendations['reduction_pct']:.1f}%")
@@ -345,8 +384,15 @@ def main():
     }
     
     Path("out").mkdir(exist_ok=True)
-    with open("out/variance_analysis.json", "w") as f:
-        json.dump(analysis_output, f, indent=2)
+    analysis_path = "out/variance_analysis.json"
+    if ORJSON_AVAILABLE:
+        Path(analysis_path).write_bytes(orjson.dumps(
+            analysis_output,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        ))
+    else:
+        with open(analysis_path, "w") as f:
+            json.dump(analysis_output, f, indent=2)
     print("  ✓ Saved out/variance_analysis.json")
     
     # Save top outliers CSV
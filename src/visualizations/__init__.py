@@ -1,12 +1,14 @@
 import importlib
-import inspect
+from functools import lru_cache
 from pathlib import Path
 from typing import Type
 
 from src.visualizations.base import Visualization, DataContext
 
 
-def discover_visualizations() -> dict[str, Type[Visualization]]:
+@lru_cache(maxsize=1)
+def _load_registry() -> dict[str, Type[Visualization]]:
+    # Globbing and importing only needs to happen once per process
     registry = {}
     visualizations_dir = Path(__file__).parent
     for file_path in visualizations_dir.glob("*.py"):
@@ -15,8 +17,9 @@ def discover_visualizations() -> dict[str, Type[Visualization]]:
         module_name = f"src.visualizations.{file_path.stem}"
         try:
             module = importlib.import_module(module_name)
-            for _, obj in inspect.getmembers(module, inspect.isclass):
-                if (issubclass(obj, Visualization) and
+            for obj in vars(module).values():
+                if (isinstance(obj, type) and
+                    issubclass(obj, Visualization) and
                     obj is not Visualization and
                     hasattr(obj, 'run')):
                     registry[obj.name] = obj
@@ -26,6 +29,10 @@ def discover_visualizations() -> dict[str, Type[Visualization]]:
     return registry
 
 
+def discover_visualizations() -> dict[str, Type[Visualization]]:
+    return dict(_load_registry())
+
+
 def get_visualizations_by_category() -> dict[str, list[Type[Visualization]]]:
     visualizations = discover_visualizations()
     by_category = {}
@@ -21,37 +21,42 @@ class ChamberComparisonAnalysis(Visualization):
         msg += "leadership stipends"
         print(msg)
         print("=" * 80)
-        house_members = [
-            r for r in context.computed_rows
-            if r.get("chamber") == "House"
-        ]
-        senate_members = [
-            r for r in context.computed_rows
-            if r.get("chamber") == "Senate"
-        ]
-        if not house_members or not senate_members:
+        # Single pass over the rows, collecting per-chamber totals
+        stats = {
+            chamber: {"count": 0, "total_comp": [], "stipends": []}
+            for chamber in ("House", "Senate")
+        }
+        for r in context.computed_rows:
+            chamber_stats = stats.get(r.get("chamber"))
+            if chamber_stats is None:
+                continue
+            chamber_stats["count"] += 1
+            total_comp = r.get("total_comp")
+            if total_comp:
+                chamber_stats["total_comp"].append(total_comp)
+            if r.get("role_stipends_total", 0) > 0:
+                chamber_stats["stipends"].append(r["role_stipends_total"])
+        h_cnt = stats["House"]["count"]
+        s_cnt = stats["Senate"]["count"]
+        if not h_cnt or not s_cnt:
             print("Insufficient data for comparison.")
             return
         print(f"\n{'Metric':<40} {'House':>18} {'Senate':>18}")
         print("-" * 80)
-        h_cnt = len(house_members)
-        s_cnt = len(senate_members)
         print(f"{'Total Members':<40} {h_cnt:>18} {s_cnt:>18}")
-        house_with_stipends = sum(
-            1 for r in house_members if r.get("role_stipends_total", 0) > 0
-        )
-        senate_with_stipends = sum(
-            1 for r in senate_members if r.get("role_stipends_total", 0) > 0
-        )
+        house_stipends = stats["House"]["stipends"]
+        senate_stipends = stats["Senate"]["stipends"]
+        house_with_stipends = len(house_stipends)
+        senate_with_stipends = len(senate_stipends)
         print(
             f"{'Members with Leadership Stipends':<40} "
             f"{house_with_stipends:>18} {senate_with_stipends:>18}"
         )
-        if house_members:
+        if h_cnt:
             house_stipend_pct = house_with_stipends / h_cnt * 100
         else:
             house_stipend_pct = 0
-        if senate_members:
+        if s_cnt:
             senate_stipend_pct = senate_with_stipends / s_cnt * 100
         else:
             senate_stipend_pct = 0
@@ -62,12 +67,8 @@ class ChamberComparisonAnalysis(Visualization):
             f"{h_pct_str:>18} {s_pct_str:>18}"
         )
         print()
-        house_total_comp = [
-            r["total_comp"] for r in house_members if r.get("total_comp")
-        ]
-        senate_total_comp = [
-            r["total_comp"] for r in senate_members if r.get("total_comp")
-        ]
+        house_total_comp = stats["House"]["total_comp"]
+        senate_total_comp = stats["Senate"]["total_comp"]
         if house_total_comp:
             house_avg = mean(house_total_comp)
             house_med = median(house_total_comp)
@@ -93,14 +94,6 @@ class ChamberComparisonAnalysis(Visualization):
         s_max_str = self.format_currency(senate_max)
         print(f"{label:<40} {h_max_str:>18} {s_max_str:>18}")
         print()
-        house_stipends = [
-            r["role_stipends_total"] for r in house_members
-            if r.get("role_stipends_total", 0) > 0
-        ]
-        senate_stipends = [
-            r["role_stipends_total"] for r in senate_members
-            if r.get("role_stipends_total", 0) > 0
-        ]
         if house_stipends:
             house_avg_stipend = mean(house_stipends)
             house_total_stipends = sum(house_stipends)
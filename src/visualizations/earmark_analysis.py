@@ -2,9 +2,20 @@
 Visualizations analyzing earmarks and their correlation with stipends.
 """
 
+from collections import defaultdict
+from operator import itemgetter
+
 from src.visualizations.base import Visualization, DataContext
 
 
+def _members_by_code(members: list[dict]) -> dict[str, dict]:
+    """Index members by member_code, keeping the first entry per code."""
+    by_code = {}
+    for m in members:
+        by_code.setdefault(m.get("member_code"), m)
+    return by_code
+
+
 class TopEarmarkRecipients(Visualization):
     """Visualization listing members with most earmarks."""
 
@@ -30,6 +41,7 @@ class TopEarmarkRecipients(Visualization):
         print("=" * 80)
 
         # Aggregate earmark statistics
+        members_by_code = _members_by_code(context.members)
         member_stats = []
         for member_code, earmarks in context.earmarks_by_member.items():
             if member_code == "UNKNOWN":
@@ -45,22 +57,17 @@ class TopEarmarkRecipients(Visualization):
                 continue
 
             # Get member info
-            member_info = next(
-                (
-                    m for m in context.members
-                    if m.get("member_code") == member_code
-                ),
-                {}
-            )
+            member_info = members_by_code.get(member_code, {})
 
+            total = sum(amounts)
             member_stats.append({
                 "member_code": member_code,
                 "name": member_info.get("name", "Unknown"),
                 "chamber": member_info.get("branch", "Unknown"),
                 "district": member_info.get("district", "Unknown"),
                 "count": len(earmarks),
-                "total": sum(amounts),
-                "average": sum(amounts) / len(amounts),
+                "total": total,
+                "average": total / len(amounts),
                 "max": max(amounts),
             })
 
@@ -69,33 +76,33 @@ class TopEarmarkRecipients(Visualization):
             return
 
         # Sort by total dollars
-        member_stats.sort(key=lambda x: x["total"], reverse=True)
+        member_stats.sort(key=itemgetter("total"), reverse=True)
 
         total_earmarks = sum(m["count"] for m in member_stats)
         total_dollars = sum(m["total"] for m in member_stats)
+        fmt = self.format_currency
 
         print(f"\nTotal members with earmarks: {len(member_stats)}")
         print(f"Total earmarks (matched): {total_earmarks}")
         total_msg = "Total earmark dollars (matched): "
-        total_msg += self.format_currency(total_dollars)
+        total_msg += fmt(total_dollars)
         print(total_msg)
         
         # Report UNKNOWN earmarks separately
         unknown_earmarks = context.earmarks_by_member.get("UNKNOWN", [])
         if unknown_earmarks:
-            unknown_amounts = [
-                e.get("amount", 0)
+            unknown_total = sum(
+                e["amount"]
                 for e in unknown_earmarks
                 if e.get("amount") is not None
-            ]
-            unknown_total = sum(unknown_amounts)
+            )
             unknown_msg = (
                 f"UNKNOWN sponsors: {len(unknown_earmarks)} earmarks, "
-                f"{self.format_currency(unknown_total)}"
+                f"{fmt(unknown_total)}"
             )
             print(unknown_msg)
             grand_msg = "Grand total (matched + unknown): "
-            grand_msg += self.format_currency(total_dollars + unknown_total)
+            grand_msg += fmt(total_dollars + unknown_total)
             print(grand_msg)
 
         print("\nTop 20 recipients:\n")
@@ -103,23 +110,24 @@ class TopEarmarkRecipients(Visualization):
             f"{'Rank':<6} {'Name':<30} {'Chamber':<8} "
             f"{'Count':>7} {'Total':>15} {'Average':>15}"
         )
-        print(header)
-        print("-" * 90)
+        # Build the table and write it with a single print
+        lines = [header, "-" * 90]
 
         for idx, member in enumerate(member_stats[:20], 1):
             name = member["name"][:28]
             chamber = member["chamber"]
             count = member["count"]
-            total = self.format_currency(member["total"])
-            avg = self.format_currency(member["average"])
+            total = fmt(member["total"])
+            avg = fmt(member["average"])
 
             row = (
                 f"{idx:<6} {name:<30} {chamber:<8} "
                 f"{count:>7} {total:>15} {avg:>15}"
             )
-            print(row)
+            lines.append(row)
 
-        print("=" * 90)
+        lines.append("=" * 90)
+        print("\n".join(lines))
 
 
 class EarmarkStipendCorrelation(Visualization):
@@ -155,28 +163,31 @@ class EarmarkStipendCorrelation(Visualization):
         print("=" * 80)
 
         # Build combined dataset
+        # Walk computed_rows in order: ties in the quartile sorts below
+        # keep this order, so it decides the overlap report
+        earmarks_by_member = context.earmarks_by_member
         combined = []
         for row in context.computed_rows:
-            member_code = row.get("member_id", "")
-            if member_code in context.earmarks_by_member:
-                earmarks = context.earmarks_by_member[member_code]
-                amounts = [
-                    e.get("amount", 0)
-                    for e in earmarks
-                    if e.get("amount") is not None
-                ]
-
-                if amounts:
-                    combined.append({
-                        "name": row.get("name", "Unknown"),
-                        "chamber": row.get("chamber", "Unknown"),
-                        "district": row.get("district", "Unknown"),
-                        "leadership_stipend": row.get(
-                            "role_stipends_total", 0
-                        ),
-                        "earmark_count": len(earmarks),
-                        "earmark_total": sum(amounts),
-                    })
+            earmarks = earmarks_by_member.get(row.get("member_id", ""))
+            if earmarks is None:
+                continue
+            amounts = [
+                e.get("amount", 0)
+                for e in earmarks
+                if e.get("amount") is not None
+            ]
+
+            if amounts:
+                combined.append({
+                    "name": row.get("name", "Unknown"),
+                    "chamber": row.get("chamber", "Unknown"),
+                    "district": row.get("district", "Unknown"),
+                    "leadership_stipend": row.get(
+                        "role_stipends_total", 0
+                    ),
+                    "earmark_count": len(earmarks),
+                    "earmark_total": sum(amounts),
+                })
 
         if not combined:
             print("\nNo members with both stipends and earmarks found.")
@@ -191,11 +202,11 @@ class EarmarkStipendCorrelation(Visualization):
         # Quartile analysis
         combined_by_stipend = sorted(
             combined,
-            key=lambda x: x["leadership_stipend"],
+            key=itemgetter("leadership_stipend"),
             reverse=True
         )
         combined_by_earmark = sorted(
-            combined, key=lambda x: x["earmark_total"], reverse=True
+            combined, key=itemgetter("earmark_total"), reverse=True
         )
 
         top_quartile_size = max(1, len(combined) // 4)
@@ -216,16 +227,15 @@ class EarmarkStipendCorrelation(Visualization):
         )
         print(msg)
 
+        fmt = self.format_currency
         if overlap:
             print("\nMembers high in both categories:")
             for member in combined:
                 if member["name"] in overlap:
                     name = member["name"]
-                    stipend = self.format_currency(
-                        member["leadership_stipend"]
-                    )
+                    stipend = fmt(member["leadership_stipend"])
                     earmarks = member["earmark_count"]
-                    total = self.format_currency(member["earmark_total"])
+                    total = fmt(member["earmark_total"])
                     print(f"  • {name}")
                     print(f"      Leadership stipend: {stipend}")
                     print(f"      Earmarks: {earmarks} totaling {total}")
@@ -235,28 +245,32 @@ class EarmarkStipendCorrelation(Visualization):
         print("DISTRIBUTION BY CHAMBER")
         print("-" * 80)
 
-        house = [m for m in combined if "house" in m["chamber"].lower()]
-        senate = [m for m in combined if "senate" in m["chamber"].lower()]
+        house = []
+        senate = []
+        for m in combined:
+            chamber = m["chamber"].lower()
+            if "house" in chamber:
+                house.append(m)
+            if "senate" in chamber:
+                senate.append(m)
 
         if house:
             house_earmarks = sum(m["earmark_count"] for m in house)
             house_dollars = sum(m["earmark_total"] for m in house)
             print(f"\nHouse: {len(house)} members")
             print(f"  Total earmarks: {house_earmarks}")
-            print(f"  Total dollars: {self.format_currency(house_dollars)}")
+            print(f"  Total dollars: {fmt(house_dollars)}")
             avg = house_dollars / len(house)
-            print(f"  Average per member: {self.format_currency(avg)}")
+            print(f"  Average per member: {fmt(avg)}")
 
         if senate:
             senate_earmarks = sum(m["earmark_count"] for m in senate)
             senate_dollars = sum(m["earmark_total"] for m in senate)
             print(f"\nSenate: {len(senate)} members")
             print(f"  Total earmarks: {senate_earmarks}")
-            print(
-                f"  Total dollars: {self.format_currency(senate_dollars)}"
-            )
+            print(f"  Total dollars: {fmt(senate_dollars)}")
             avg = senate_dollars / len(senate)
-            print(f"  Average per member: {self.format_currency(avg)}")
+            print(f"  Average per member: {fmt(avg)}")
 
         print("=" * 80)
 
@@ -286,18 +300,15 @@ class EarmarksByDistrict(Visualization):
         print("=" * 80)
 
         # Build district-level statistics
-        district_stats = {}
+        members_by_code = _members_by_code(context.members)
+        district_stats = defaultdict(
+            lambda: {"count": 0, "total": 0.0, "members": []}
+        )
         for member_code, earmarks in context.earmarks_by_member.items():
             if member_code == "UNMATCHED":
                 continue
 
-            member = next(
-                (
-                    m for m in context.members
-                    if m.get("member_code") == member_code
-                ),
-                {}
-            )
+            member = members_by_code.get(member_code, {})
 
             district = member.get("district", "Unknown")
             chamber = member.get("branch", "Unknown")
@@ -311,20 +322,13 @@ class EarmarksByDistrict(Visualization):
             if not amounts:
                 continue
 
-            if district not in district_stats:
-                district_stats[district] = {
-                    "district": district,
-                    "chamber": chamber,
-                    "count": 0,
-                    "total": 0.0,
-                    "members": []
-                }
-
-            district_stats[district]["count"] += len(earmarks)
-            district_stats[district]["total"] += sum(amounts)
-            district_stats[district]["members"].append(
-                member.get("name", "Unknown")
-            )
+            # The first member seen sets the district's chamber
+            stats = district_stats[district]
+            stats.setdefault("district", district)
+            stats.setdefault("chamber", chamber)
+            stats["count"] += len(earmarks)
+            stats["total"] += sum(amounts)
+            stats["members"].append(member.get("name", "Unknown"))
 
         if not district_stats:
             print("\nNo district data found.")
@@ -333,7 +337,7 @@ class EarmarksByDistrict(Visualization):
         # Convert to list and sort
         districts = sorted(
             district_stats.values(),
-            key=lambda x: x["total"],
+            key=itemgetter("total"),
             reverse=True
         )
 
@@ -344,19 +348,20 @@ class EarmarksByDistrict(Visualization):
             f"{'Rank':<6} {'District':<20} {'Chamber':<8} "
             f"{'Count':>7} {'Total':>15}"
         )
-        print(header)
-        print("-" * 70)
+        lines = [header, "-" * 70]
 
+        fmt = self.format_currency
         for idx, dist in enumerate(districts[:20], 1):
             district = dist["district"][:18]
             chamber = dist["chamber"]
             count = dist["count"]
-            total = self.format_currency(dist["total"])
+            total = fmt(dist["total"])
 
             row = (
                 f"{idx:<6} {district:<20} {chamber:<8} "
                 f"{count:>7} {total:>15}"
             )
-            print(row)
+            lines.append(row)
 
-        print("=" * 70)
+        lines.append("=" * 70)
+        print("\n".join(lines))